@@ -1,15 +1,50 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
+import asyncio
+import hashlib
+import io
+import time
+
 import httpx
-import os
-import tempfile
-import PyPDF2
+import orjson
+import fitz  # PyMuPDF
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, List, Dict, Any
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Single shared HTTP client so connections to Groq are pooled and reused
+    # instead of paying a TCP + TLS handshake on every call. HTTP/2 lets
+    # concurrent calls multiplex over one connection.
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,  # retry connect failures at the transport level
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    yield
+    await app.state.http.aclose()
+    _log_listener.stop()
+
 # Initialize FastAPI app
-app = FastAPI(title="Resume and Job Description Parser API")
+app = FastAPI(
+    title="Resume and Job Description Parser API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -27,22 +62,93 @@ if not GROQ_API_KEY:
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
-# Create a logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+UPLOAD_CHUNK_SIZE = 1 << 20  # read uploads 1 MiB at a time
 
-# Create a file handler and a stream handler
-file_handler = logging.FileHandler('app.log')
-stream_handler = logging.StreamHandler()
+# Hard caps so a huge PDF can't tie up the parser or blow the Groq
+# context window before we notice
+MAX_PDF_BYTES = 10_000_000
+MAX_PDF_PAGES = 50
+MAX_TEXT_CHARS = 100_000
 
-# Create a formatter and set it for the handlers
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-stream_handler.setFormatter(formatter)
+# Documents estimated above CHUNK_TOKEN_LIMIT tokens are split into
+# ~CHUNK_TARGET_TOKENS chunks and parsed map-reduce style so they fit
+# llama3-70b-8192's 8192-token context window
+CHUNK_TOKEN_LIMIT = 6000
+CHUNK_TARGET_TOKENS = 1500
+
+# Batched calls share the 8192-token window between the batch system
+# prompt, every resume's input text AND the JSON completion for every
+# resume in the group, so the input budget sits well below
+# CHUNK_TOKEN_LIMIT and each resume reserves an output estimate on top
+# of its input tokens.
+BATCH_TOKEN_BUDGET = 3500
+BATCH_OUTPUT_TOKENS_PER_RESUME = 400
 
-# Add the handlers to the logger
-logger.addHandler(file_handler)
-logger.addHandler(stream_handler)
+# Bound on in-flight Groq calls so chunked/batch fan-outs don't trip the
+# API rate limits
+GROQ_MAX_CONCURRENCY = 10
+_groq_semaphore = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+class _TTLCache:
+    """Bounded in-process TTL cache with LRU eviction
+
+    Stands in for a Redis SETEX cache: entries self-expire and the size is
+    capped so a long-running process can't accumulate one entry per distinct
+    input forever. Expired entries are dropped on access and on insert.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        # Drop entries that have already expired, then enforce the size
+        # bound least-recently-used first
+        while self._data:
+            oldest = next(iter(self._data))
+            if self._data[oldest][0] <= now:
+                del self._data[oldest]
+            else:
+                break
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+# In-process cache of parsed Groq results keyed by content hash, so
+# byte-identical resumes/JDs (retries, reprocessing) skip the multi-second
+# LLM round-trip. Keys are partitioned by is_resume since the same text
+# parses differently per prompt.
+GROQ_CACHE_TTL = 86400  # 24 hours
+GROQ_CACHE_MAX_ENTRIES = 1024
+_groq_cache = _TTLCache(GROQ_CACHE_TTL, GROQ_CACHE_MAX_ENTRIES)
+
+def _groq_cache_key(text: str, is_resume: bool) -> str:
+    return hashlib.sha256(text.encode()).hexdigest() + str(is_resume)
+
+# Extracted PDF text keyed by content hash, so retried uploads of the
+# same file skip the parse entirely. BLAKE2b is faster than SHA-256 and
+# collision resistance is all we need here. Entries are up to
+# MAX_TEXT_CHARS each, so the cap is kept small.
+PDF_TEXT_CACHE_TTL = 3600  # 1 hour
+PDF_TEXT_CACHE_MAX_ENTRIES = 256
+_pdf_text_cache = _TTLCache(PDF_TEXT_CACHE_TTL, PDF_TEXT_CACHE_MAX_ENTRIES)
+
+def _pdf_cache_key(pdf_bytes: bytes) -> str:
+    return "pdf:" + hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
 
 class ResumeInfo(BaseModel):
     name: Optional[str] = None
@@ -63,169 +169,400 @@ class JobInfo(BaseModel):
     education_requirements: Dict[str, Any] = {}
     responsibilities: List[str] = []
 
+# System prompts are module constants so every request sends the exact same
+# bytes, keeping the payload build cheap and letting Groq reuse its prompt
+# prefix cache across requests. The expected shape is stated as the models'
+# JSON schema rather than a prose spec - a third of the prompt tokens for
+# the same constraint.
+_RESUME_SCHEMA = orjson.dumps(ResumeInfo.model_json_schema()).decode()
+_JOB_SCHEMA = orjson.dumps(JobInfo.model_json_schema()).decode()
+
+RESUME_SYSTEM_PROMPT = (
+    "You are an expert resume parser. Extract the candidate's information from "
+    "the resume text and return a JSON object matching this schema exactly:\n"
+    + _RESUME_SCHEMA
+)
+
+JD_SYSTEM_PROMPT = (
+    "You are an expert job description analyzer. Extract the job's information "
+    "from the job description text and return a JSON object matching this "
+    "schema exactly:\n"
+    + _JOB_SCHEMA
+)
+
+BATCH_RESUME_SYSTEM_PROMPT = (
+    "You are an expert resume parser. You will receive several resumes, each "
+    "introduced by a line of the form \"--- RESUME N ---\". Return a JSON object "
+    "with a single key \"resumes\" whose value is an array containing one object "
+    "per resume, in the same order as the input, each matching this schema "
+    "exactly:\n"
+    + _RESUME_SCHEMA
+)
+
+PARTIAL_DOCUMENT_NOTE = """
+        Note: the text you receive is one part of a longer document. Extract
+        only what is present in this part and leave missing fields empty.
+        """
+
+BASE_HEADERS = {
+    "Authorization": f"Bearer {GROQ_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+GROQ_MODEL = "llama3-70b-8192"  # accurate fallback model
+GROQ_FAST_MODEL = "llama3-8b-8192"  # first attempt; far faster and cheaper on Groq
+
+# Payload skeletons built once at import time; per call we only shallow-copy
+# and slot in the user message. Keeping the system message object constant
+# also keeps the prompt prefix byte-stable for Groq's KV cache.
+def _payload_template(system_prompt: str) -> Dict[str, Any]:
+    return {
+        "model": GROQ_MODEL,
+        "messages": [{"role": "system", "content": system_prompt}, None],
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"},
+    }
+
+RESUME_PAYLOAD_TEMPLATE = _payload_template(RESUME_SYSTEM_PROMPT)
+JD_PAYLOAD_TEMPLATE = _payload_template(JD_SYSTEM_PROMPT)
+BATCH_RESUME_PAYLOAD_TEMPLATE = _payload_template(BATCH_RESUME_SYSTEM_PROMPT)
+RESUME_PARTIAL_PAYLOAD_TEMPLATE = _payload_template(RESUME_SYSTEM_PROMPT + PARTIAL_DOCUMENT_NOTE)
+JD_PARTIAL_PAYLOAD_TEMPLATE = _payload_template(JD_SYSTEM_PROMPT + PARTIAL_DOCUMENT_NOTE)
+
+def _fill_payload(template: Dict[str, Any], text: str) -> Dict[str, Any]:
+    payload = template.copy()
+    payload["messages"] = [template["messages"][0], {"role": "user", "content": text}]
+    return payload
+
+# Create a logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Create a file handler and a stream handler
+file_handler = logging.FileHandler('app.log')
+stream_handler = logging.StreamHandler()
+
+# Create a formatter and set it for the handlers
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler.setFormatter(formatter)
+stream_handler.setFormatter(formatter)
+
+# Route records through a queue so the disk and console writes happen on
+# a background thread instead of blocking the event loop
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, file_handler, stream_handler)
+_log_listener.start()
+
+def _extract_sync(pdf_bytes: bytes) -> str:
+    """Synchronous PDF parse, run off the event loop via asyncio.to_thread"""
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    if doc.page_count > MAX_PDF_PAGES:
+        doc.close()
+        raise HTTPException(status_code=413, detail=f"PDF has too many pages (max {MAX_PDF_PAGES})")
+    text = "".join(page.get_text("text") for page in doc)
+    doc.close()
+    return text
+
 async def extract_text_from_pdf(pdf_file: UploadFile) -> str:
     """Extract text content from uploaded PDF file"""
+    if pdf_file.size and pdf_file.size > MAX_PDF_BYTES:
+        logger.error(f"Rejected oversized PDF: {pdf_file.size} bytes")
+        raise HTTPException(status_code=413, detail=f"PDF too large (max {MAX_PDF_BYTES} bytes)")
+
     try:
-        # Create a temporary file to save the uploaded PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            # Write the uploaded file content to the temporary file
-            temp_file.write(await pdf_file.read())
-            temp_path = temp_file.name
-        
-        logger.info(f"Saved uploaded PDF to temporary file: {temp_path}")
-
-        # Extract text from the PDF
-        text = ""
-        with open(temp_path, "rb") as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                text += pdf_reader.pages[page_num].extract_text()
-        
-        # Clean up the temporary file
-        os.unlink(temp_path)
-        
+        # Stream the upload in fixed-size chunks so the event loop yields
+        # between reads, then parse in a worker thread so it also keeps
+        # serving other requests during the CPU-bound parse
+        buf = io.BytesIO()
+        while chunk := await pdf_file.read(UPLOAD_CHUNK_SIZE):
+            buf.write(chunk)
+            if buf.tell() > MAX_PDF_BYTES:
+                logger.error("Rejected oversized PDF mid-upload")
+                raise HTTPException(status_code=413, detail=f"PDF too large (max {MAX_PDF_BYTES} bytes)")
+        pdf_bytes = buf.getvalue()
+
+        cache_key = _pdf_cache_key(pdf_bytes)
+        cached = _pdf_text_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached PDF text")
+            return cached
+
+        text = await asyncio.to_thread(_extract_sync, pdf_bytes)
+        _pdf_text_cache.set(cache_key, text)
+
         logger.info(f"Extracted {len(text)} characters from PDF")
         return text
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error extracting text from PDF: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error extracting text from PDF: {str(e)}")
 
+async def _groq_chat(payload: Dict[str, Any]) -> str:
+    """POST a chat-completion payload to Groq and return the message content"""
+    logger.info(f"Sending request to Groq API with model: {payload['model']}")
+
+    try:
+        async with _groq_semaphore:
+            response = await app.state.http.post(GROQ_API_URL, json=payload, headers=BASE_HEADERS)
+    except httpx.RequestError as e:
+        logger.error(f"Error communicating with Groq API: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error communicating with Groq API: {str(e)}")
+
+    if response.status_code != 200:
+        logger.error(f"Groq API Error: {response.status_code} - {response.text}")
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Groq API Error: {response.text}"
+        )
+
+    # Decode the raw bytes with orjson rather than response.json()
+    result = orjson.loads(response.content)
+    logger.info("Successfully received response from Groq API")
+    return result["choices"][0]["message"]["content"]
+
+def _estimate_tokens(text: str) -> int:
+    # Rough heuristic: ~4 characters per token for English text
+    return len(text) // 4
+
+# Boundary preference for the chunk splitter. fitz emits single-newline
+# line breaks, so the "\n" level matters: a PDF with few blank lines
+# would otherwise collapse into one oversized "paragraph".
+_SPLIT_SEPARATORS = ["\n\n", "\n", ". "]
+
+def _split_pieces(text: str, limit: int, separators: List[str]) -> List[str]:
+    """Break text into pieces of at most limit characters
+
+    Tries each separator level in order, keeping the separator attached to
+    the piece it ended so no characters are lost, and falls back to a hard
+    character split when no separator level fits.
+    """
+    if len(text) <= limit:
+        return [text]
+    if not separators:
+        return [text[i:i + limit] for i in range(0, len(text), limit)]
+    sep, rest = separators[0], separators[1:]
+    parts = text.split(sep)
+    parts = [part + sep for part in parts[:-1]] + [parts[-1]]
+    pieces: List[str] = []
+    for part in parts:
+        pieces.extend(_split_pieces(part, limit, rest))
+    return pieces
+
+def _split_text(text: str, target_tokens: int = CHUNK_TARGET_TOKENS) -> List[str]:
+    """Split text into ~target_tokens chunks, preferring paragraph, then
+    line, then sentence boundaries"""
+    limit = target_tokens * 4
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    # Pieces keep their trailing separators, so chunks are joined with ""
+    for piece in _split_pieces(text, limit, _SPLIT_SEPARATORS):
+        if current and current_len + len(piece) > limit:
+            chunks.append("".join(current))
+            current = []
+            current_len = 0
+        current.append(piece)
+        current_len += len(piece)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+def _merge_parsed(results: List[Any]) -> Dict[str, Any]:
+    """Reduce per-chunk partial parses into one dict, deduplicating lists"""
+    merged: Dict[str, Any] = {}
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        for key, value in result.items():
+            existing = merged.get(key)
+            if existing is None or existing == "" or existing == [] or existing == {}:
+                merged[key] = value
+            elif isinstance(existing, list) and isinstance(value, list):
+                for item in value:
+                    if item not in existing:
+                        existing.append(item)
+            elif isinstance(existing, dict) and isinstance(value, dict):
+                merged[key] = _merge_parsed([existing, value])
+    return merged
+
+async def _chat_and_parse(payload: Dict[str, Any]) -> Any:
+    """Send one payload to Groq and return the parsed dict (or raw content on bad JSON)"""
+    extracted_info = await _groq_chat(payload)
+
+    # The response should already be JSON but let's ensure it's parsed
+    try:
+        parsed_info = orjson.loads(extracted_info)
+        logger.info("Successfully parsed JSON response")
+        return parsed_info
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"JSON parsing error: {str(e)}")
+        logger.info(f"Returning unparsed Groq API response")
+        return extracted_info  # Return as is if already parsed
+
+def _looks_complete(parsed: Any, model_cls: type) -> bool:
+    """Confidence check on a fast-model parse before accepting it"""
+    if not isinstance(parsed, dict):
+        return False
+    try:
+        model_cls(**parsed)
+    except (ValidationError, TypeError):
+        return False
+    # Every field on these models is optional, so validation alone accepts
+    # an empty {} - also require the fields a real parse always produces
+    if model_cls is ResumeInfo and not (parsed.get("name") or parsed.get("email")):
+        return False
+    if model_cls is JobInfo and not (parsed.get("title") or parsed.get("required_skills")):
+        return False
+    return True
+
+async def _parse_with_template(text: str, template: Dict[str, Any], model_cls: type = None) -> Any:
+    """One Groq extraction call, routed to the fast model first
+
+    When model_cls is given, the fast model's output is validated against
+    it and the call is retried on the large model if validation fails or
+    the parse looks empty. Chunked partial parses pass no model_cls and
+    stay on the fast model.
+    """
+    payload = _fill_payload(template, text)
+    payload["model"] = GROQ_FAST_MODEL
+    parsed_info = await _chat_and_parse(payload)
+
+    if model_cls is not None and not _looks_complete(parsed_info, model_cls):
+        logger.info(f"Low-confidence {GROQ_FAST_MODEL} parse; retrying with {GROQ_MODEL}")
+        payload["model"] = GROQ_MODEL
+        parsed_info = await _chat_and_parse(payload)
+
+    return parsed_info
+
 async def query_groq(text: str, is_resume: bool) -> Dict[str, Any]:
     """Query Groq API to extract information from text"""
-    
+
+    if len(text) > MAX_TEXT_CHARS:
+        logger.error(f"Rejected oversized text: {len(text)} characters")
+        raise HTTPException(status_code=413, detail=f"Text too long (max {MAX_TEXT_CHARS} characters)")
+
+    cache_key = _groq_cache_key(text, is_resume)
+    cached = _groq_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached Groq result")
+        return cached
+
     if is_resume:
-        system_prompt = """
-        You are an expert resume parser. Extract the following information from the resume text:
-        1. Name of the candidate
-        2. Email address
-        3. Phone number
-        4. Technical skills (list)
-        5. Soft skills (list)
-        6. Experience details:
-           - Total years of experience
-           - Job roles (list with company, title, duration)
-           - Industry background
-        7. Education details:
-           - Degree(s)
-           - University/Institution(s)
-           - Tier ranking (if identifiable)
-        8. Projects:
-           - Name
-           - Technologies used
-           - Brief description
-        
-        Return the data in a structured JSON format with these exact keys:
-        {
-            "name": "string",
-            "email": "string",
-            "phone": "string",
-            "technical_skills": ["skill1", "skill2", ...],
-            "soft_skills": ["skill1", "skill2", ...],
-            "experience": {
-                "total_years": number,
-                "job_roles": [
-                    {"company": "string", "title": "string", "duration": "string"}
-                ],
-                "industry_background": "string"
-            },
-            "education": {
-                "degrees": ["string"],
-                "institutions": ["string"],
-                "tier_ranking": "string"
-            },
-            "projects": [
-                {
-                    "name": "string",
-                    "technologies": ["string"],
-                    "description": "string"
-                }
-            ]
-        }
-        """
+        template, partial_template = RESUME_PAYLOAD_TEMPLATE, RESUME_PARTIAL_PAYLOAD_TEMPLATE
+        model_cls = ResumeInfo
         logger.info("Processing resume text")
     else:
-        system_prompt = """
-        You are an expert job description analyzer. Extract the following information from the job description text:
-        1. Job title
-        2. Company name
-        3. Required skills (list)
-        4. Preferred/nice-to-have skills (list)
-        5. Experience requirements:
-           - Minimum years required
-           - Specific domain experience needed
-        6. Education requirements:
-           - Minimum degree required
-           - Preferred fields of study
-        7. Key responsibilities (list)
-        
-        Return the data in a structured JSON format with these exact keys:
-        {
-            "title": "string",
-            "company": "string",
-            "required_skills": ["skill1", "skill2", ...],
-            "preferred_skills": ["skill1", "skill2", ...],
-            "experience_requirements": {
-                "minimum_years": number,
-                "domain_experience": ["string"]
-            },
-            "education_requirements": {
-                "minimum_degree": "string",
-                "preferred_fields": ["string"]
-            },
-            "responsibilities": ["string"]
-        }
-        """
+        template, partial_template = JD_PAYLOAD_TEMPLATE, JD_PARTIAL_PAYLOAD_TEMPLATE
+        model_cls = JobInfo
         logger.info("Processing job description text")
-    
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "model": "llama3-70b-8192",  # Using Llama 3 70B model, adjust as needed
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text}
-        ],
-        "temperature": 0.2,
-        "response_format": {"type": "json_object"}
-    }
-    
-    logger.info(f"Sending request to Groq API with model: {payload['model']}")
-    
+
+    if _estimate_tokens(text) > CHUNK_TOKEN_LIMIT:
+        # Map-reduce: the document would overflow the model's context
+        # window, so parse each chunk independently and merge the partials
+        chunks = _split_text(text)
+        logger.info(f"Input exceeds ~{CHUNK_TOKEN_LIMIT} tokens; splitting into {len(chunks)} chunks")
+        partials = await asyncio.gather(*[
+            _parse_with_template(chunk, partial_template)
+            for chunk in chunks
+        ])
+        parsed_info = _merge_parsed(list(partials))
+    else:
+        parsed_info = await _parse_with_template(text, template, model_cls)
+
+    if isinstance(parsed_info, dict):
+        _groq_cache.set(cache_key, parsed_info)
+    return parsed_info
+
+async def _query_groq_batch_group(texts: List[str]) -> List[Dict[str, Any]]:
+    """One batched Groq call for a group of resumes, one result per input"""
+
+    user_content = "\n\n".join(
+        f"--- RESUME {i + 1} ---\n{text}" for i, text in enumerate(texts)
+    )
+
+    extracted_info = await _groq_chat(_fill_payload(BATCH_RESUME_PAYLOAD_TEMPLATE, user_content))
+
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(GROQ_API_URL, json=payload, headers=headers)
-            
-            if response.status_code != 200:
-                logger.error(f"Groq API Error: {response.status_code} - {response.text}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Groq API Error: {response.text}"
-                )
-            
-            result = response.json()
-            extracted_info = result["choices"][0]["message"]["content"]
-            
-            logger.info("Successfully received response from Groq API")
-            
-            # The response should already be JSON but let's ensure it's parsed
-            import json
-            try:
-                parsed_info = json.loads(extracted_info)
-                logger.info("Successfully parsed JSON response")
-                return parsed_info
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parsing error: {str(e)}")
-                logger.info(f"Returning unparsed Groq API response")
-                return extracted_info  # Return as is if already parsed
-    
-    except httpx.RequestError as e:
-        logger.error(f"Error communicating with Groq API: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error communicating with Groq API: {str(e)}")
+        parsed_info = orjson.loads(extracted_info)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"JSON parsing error on batch response: {str(e)}")
+        raise HTTPException(status_code=502, detail="Groq returned malformed JSON for the batch")
+
+    # Accept the requested {"resumes": [...]} wrapper or a bare top-level
+    # array; anything else is a malformed response, not a server bug
+    if isinstance(parsed_info, dict):
+        resumes = parsed_info.get("resumes")
+    elif isinstance(parsed_info, list):
+        resumes = parsed_info
+    else:
+        resumes = None
+    if not isinstance(resumes, list):
+        logger.error(f"Batch response is not a resume array: {type(parsed_info).__name__}")
+        raise HTTPException(status_code=502, detail="Groq batch response missing the resumes array")
 
-@app.post("/parse/resume", response_model=ResumeInfo)
+    # Keep results positionally aligned with the inputs: truncate extras,
+    # pad gaps with empty objects
+    if len(resumes) != len(texts):
+        logger.warning(f"Batch parse returned {len(resumes)} results for {len(texts)} resumes")
+        resumes = resumes[:len(texts)] + [{} for _ in range(len(texts) - len(resumes))]
+    return resumes
+
+async def query_groq_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """Parse several resumes in as few Groq calls as the context window allows
+
+    Texts are grouped so each call's combined input plus per-resume output
+    headroom stays under BATCH_TOKEN_BUDGET; texts too long even on their
+    own go through the single-document chunked path instead. Results come
+    back in input order.
+    """
+    for text in texts:
+        if len(text) > MAX_TEXT_CHARS:
+            logger.error(f"Rejected oversized text in batch: {len(text)} characters")
+            raise HTTPException(status_code=413, detail=f"Text too long (max {MAX_TEXT_CHARS} characters)")
+
+    groups: List[List[int]] = []
+    oversized: List[int] = []
+    current: List[int] = []
+    current_tokens = 0
+    for i, text in enumerate(texts):
+        # A resume's cost in the window is its input plus the headroom its
+        # JSON object needs in the completion
+        cost = _estimate_tokens(text) + BATCH_OUTPUT_TOKENS_PER_RESUME
+        if cost > BATCH_TOKEN_BUDGET:
+            oversized.append(i)
+            continue
+        if current and current_tokens + cost > BATCH_TOKEN_BUDGET:
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(i)
+        current_tokens += cost
+    if current:
+        groups.append(current)
+
+    if len(groups) + len(oversized) > 1:
+        logger.info(f"Splitting batch of {len(texts)} resumes into {len(groups)} calls"
+                    f" plus {len(oversized)} chunked parses")
+
+    outputs = await asyncio.gather(
+        *[_query_groq_batch_group([texts[i] for i in group]) for group in groups],
+        *[query_groq(texts[i], is_resume=True) for i in oversized],
+    )
+
+    results: List[Any] = [None] * len(texts)
+    for group, group_result in zip(groups, outputs[:len(groups)]):
+        for idx, parsed in zip(group, group_result):
+            results[idx] = parsed
+    for idx, parsed in zip(oversized, outputs[len(groups):]):
+        results[idx] = parsed
+    return results
+
+# The parse endpoints return the Groq output as-is: it is already
+# constrained to the schema by the prompt and response_format, so a
+# Pydantic validation pass per response would be duplicated work.
+@app.post("/parse/resume")
 async def parse_resume(resume_file: UploadFile = File(...)):
     """
     Parse a resume PDF and extract key information using Groq API
@@ -243,9 +580,28 @@ async def parse_resume(resume_file: UploadFile = File(...)):
     parsed_info = await query_groq(resume_text, is_resume=True)
     
     logger.info(f"Successfully parsed resume")
-    return parsed_info
+    return ORJSONResponse(parsed_info)
+
+@app.post("/parse/resumes/batch")
+async def parse_resumes_batch(resume_files: List[UploadFile] = File(...)):
+    """
+    Parse several resume PDFs in one request, using a single Groq call
+    """
+    logger.info(f"Received batch resume parsing request: {len(resume_files)} files")
 
-@app.post("/parse/job-description", response_model=JobInfo)
+    for resume_file in resume_files:
+        if resume_file.content_type != "application/pdf":
+            logger.error(f"Invalid file type: {resume_file.content_type}")
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+    # Extract text from all PDFs concurrently, then batch one Groq call
+    texts = await asyncio.gather(*[extract_text_from_pdf(f) for f in resume_files])
+    parsed_info = await query_groq_batch(list(texts))
+
+    logger.info(f"Successfully parsed {len(parsed_info)} resumes in batch")
+    return ORJSONResponse(parsed_info)
+
+@app.post("/parse/job-description")
 async def parse_job_description(job_description: str = Form(...)):
     """
     Parse a job description text and extract key information using Groq API
@@ -256,7 +612,7 @@ async def parse_job_description(job_description: str = Form(...)):
     parsed_info = await query_groq(job_description, is_resume=False)
     
     logger.info(f"Successfully parsed job description")
-    return parsed_info
+    return ORJSONResponse(parsed_info)
 
 @app.get("/health")
 async def health_check():
@@ -267,4 +623,6 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting FastAPI application")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop + httptools replace the stdlib event loop and h11 parser with
+    # their C implementations - this app is dominated by async network I/O
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
\ No newline at end of file